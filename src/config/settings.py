@@ -6,21 +6,30 @@ including layout settings, theme preferences, and update intervals.
 """
 
 import os
+import re
+import tempfile
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, asdict, field
-from rich.logging import RichHandler
 import logging
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True)]
-)
+# Logging is configured by the application entry point (main.py)
 logger = logging.getLogger("config")
 
+# Prefer the libyaml C bindings when PyYAML was built with them
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Colors are stored as #RRGGBB hex strings
+_HEX_COLOR = re.compile(r'#[0-9A-Fa-f]{6}')
+
+def _current_umask() -> int:
+    """Get the process umask, which can only be read by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
 @dataclass
 class ThemeConfig:
     """Theme configuration settings."""
@@ -56,10 +65,12 @@ class DashboardConfig:
 
     @classmethod
     def get_default_config_path(cls) -> Path:
-        """Get the default configuration file path."""
-        config_dir = Path.home() / ".config" / "process_dashboard"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / "config.yaml"
+        """Get the default configuration file path.
+
+        The directory is not created here; save() creates it when writing,
+        so merely loading never touches the filesystem.
+        """
+        return Path.home() / ".config" / "process_dashboard" / "config.yaml"
 
     def save(self, config_path: Optional[Path] = None) -> None:
         """
@@ -69,12 +80,36 @@ class DashboardConfig:
             config_path: Optional path to save the configuration file.
                        If not provided, uses the default path.
         """
+        tmp_path: Optional[Path] = None
         try:
-            config_path = config_path or self.get_default_config_path()
-            with open(config_path, 'w') as f:
-                yaml.safe_dump(asdict(self), f, default_flow_style=False)
+            # Resolve symlinks so a linked config (e.g. from a dotfile
+            # manager) is updated at its target instead of being replaced
+            config_path = (config_path or self.get_default_config_path()).resolve()
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+            data = yaml.dump(asdict(self), Dumper=SafeDumper, default_flow_style=False)
+            # Write a sibling temp file and rename it over the config so a
+            # crash mid-write never leaves a truncated config behind
+            with tempfile.NamedTemporaryFile(
+                'w', dir=config_path.parent, prefix=config_path.name,
+                suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = Path(f.name)
+                f.write(data)
+                # Make the data durable before the rename can be
+                f.flush()
+                os.fsync(f.fileno())
+            # Temp files are created 0600; keep the existing file's mode, or
+            # use the mode open() would give a new file under the umask
+            if config_path.exists():
+                mode = config_path.stat().st_mode & 0o777
+            else:
+                mode = 0o666 & ~_current_umask()
+            os.chmod(tmp_path, mode)
+            os.replace(tmp_path, config_path)
             logger.info(f"Configuration saved to {config_path}")
         except Exception as e:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             logger.error(f"Failed to save configuration: {e}")
             raise
 
@@ -97,11 +132,12 @@ class DashboardConfig:
                 return cls()
 
             with open(config_path) as f:
-                config_data = yaml.safe_load(f)
+                config_data = yaml.load(f, Loader=SafeLoader) or {}
 
-            theme_data = config_data.get('theme', {})
-            layout_data = config_data.get('layout', {})
-            updates_data = config_data.get('updates', {})
+            # An empty file or an empty section parses as None
+            theme_data = config_data.get('theme') or {}
+            layout_data = config_data.get('layout') or {}
+            updates_data = config_data.get('updates') or {}
 
             return cls(
                 theme=ThemeConfig(**theme_data),
@@ -120,35 +156,38 @@ class DashboardConfig:
         Returns:
             bool: True if configuration is valid, False otherwise.
         """
-        try:
-            # Validate update intervals
-            if (self.updates.process_update_interval <= 0 or
-                self.updates.resource_update_interval <= 0 or
-                self.updates.disk_update_interval <= 0):
-                logger.error("Update intervals must be positive numbers")
-                return False
+        # Validate update intervals; YAML may hand back strings or booleans,
+        # which are rejected here rather than failing a comparison later
+        intervals = (
+            self.updates.process_update_interval,
+            self.updates.resource_update_interval,
+            self.updates.disk_update_interval
+        )
+        if not all(
+            isinstance(i, (int, float)) and not isinstance(i, bool) for i in intervals
+        ) or min(intervals) <= 0:
+            logger.error("Update intervals must be positive numbers")
+            return False
+
+        # Validate grid dimensions
+        grid = (self.layout.grid_rows, self.layout.grid_columns)
+        if not all(isinstance(n, int) and not isinstance(n, bool) for n in grid) or min(grid) < 1:
+            logger.error("Grid dimensions must be positive numbers")
+            return False
 
-            # Validate grid dimensions
-            if self.layout.grid_rows < 1 or self.layout.grid_columns < 1:
-                logger.error("Grid dimensions must be positive numbers")
+        # Validate color formats
+        color_attrs = (
+            self.theme.background_color,
+            self.theme.text_color,
+            self.theme.accent_color,
+            self.theme.border_color
+        )
+        for color in color_attrs:
+            if not isinstance(color, str) or not _HEX_COLOR.fullmatch(color):
+                logger.error(f"Invalid color format: {color}")
                 return False
 
-            # Validate color formats
-            color_attrs = [
-                self.theme.background_color,
-                self.theme.text_color,
-                self.theme.accent_color,
-                self.theme.border_color
-            ]
-            for color in color_attrs:
-                if not color.startswith('#') or len(color) != 7:
-                    logger.error(f"Invalid color format: {color}")
-                    return False
-
-            return True
-        except Exception as e:
-            logger.error(f"Configuration validation failed: {e}")
-            return False
+        return True
 
 def load_or_create_config(config_path: Optional[Path] = None) -> DashboardConfig:
     """
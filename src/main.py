@@ -7,9 +7,8 @@ featuring a matrix-themed interface with configurable layouts and process monito
 
 import logging
 import time
-from typing import ClassVar
+from typing import ClassVar, List
 from datetime import datetime
-from pathlib import Path
 
 from textual.app import App, ComposeResult
 from textual.binding import Binding
@@ -18,11 +17,11 @@ from textual.widgets import (
     Header, Footer, Static, Label, DataTable,
     Tree, Button
 )
+from textual.widgets.data_table import ColumnKey
 from textual.reactive import reactive
 from textual.message import Message
 from rich.text import Text
 from rich.logging import RichHandler
-from rich.tree import Tree as RichTree
 
 from config.settings import DashboardConfig, load_or_create_config
 from processes.monitor import ProcessMonitor, ProcessInfo, SystemResources
@@ -32,89 +31,18 @@ from ui.file_browser import FileBrowser
 from ui.resource_monitor import ResourceMonitor
 from ui.config_panel import ConfigPanel
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[RichHandler(rich_tracebacks=True)]
-)
 logger = logging.getLogger("dashboard")
 
-class DiskUsageWidget(Static):
-    """Widget for displaying disk usage information."""
-
-    def __init__(self):
-        """Initialize the disk usage widget."""
-        super().__init__()
-        self.rich_tree = RichTree("Root")
-        self.root_path = Path.home()  # Start from user's home directory for safety
-
-    def on_mount(self) -> None:
-        """Set up the directory tree on mount."""
-        self.update_disk_usage()
-
-    def render(self) -> RichTree:
-        """Render the disk usage tree.
-        
-        Returns:
-            RichTree: The rendered tree structure
-        """
-        return self.rich_tree
-
-    def update_disk_usage(self) -> None:
-        """Update the disk usage tree."""
-        self.rich_tree = RichTree(f"📁 {self.root_path} (scanning...)")
-        
-        try:
-            # Add immediate children of root path
-            for entry in sorted(self.root_path.iterdir()):
-                if not entry.name.startswith('.'):
-                    size = self.get_size(entry)
-                    icon = "📁" if entry.is_dir() else "📄"
-                    label = f"{icon} {entry.name} ({size})"
-                    self.rich_tree.add(label)
-            
-            # Update root label with total size
-            root_size = self.get_size(self.root_path)
-            self.rich_tree.label = f"📁 {self.root_path} ({root_size})"
-        except PermissionError:
-            root.label = f"📁 {self.root_path} (access denied)"
-        except Exception as e:
-            root.label = f"📁 {self.root_path} (error: {str(e)})"
-
-    def get_size(self, path: Path) -> str:
-        """Get human-readable size of a file or directory.
-
-        Args:
-            path: Path to get size for.
-
-        Returns:
-            str: Human-readable size string.
-        """
-        try:
-            if path.is_file():
-                size = path.stat().st_size
-            else:
-                total = sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
-                size = total
-            
-            for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-                if size < 1024:
-                    return f"{size:.1f}{unit}"
-                size /= 1024
-            return f"{size:.1f}PB"
-        except (PermissionError, FileNotFoundError):
-            return "N/A"
-        except Exception:
-            return "Error"
-
 class ProcessListWidget(Static):
     """Widget for displaying and managing process list."""
 
+    COLUMNS = ("PID", "Name", "CPU %", "Memory %", "Status", "User", "Started")
+
     def __init__(self, monitor: ProcessMonitor):
         super().__init__()
         self.monitor = monitor
         self.process_table = DataTable()
+        self._column_keys: List[ColumnKey] = []
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -122,58 +50,41 @@ class ProcessListWidget(Static):
 
     def on_mount(self) -> None:
         """Set up the process table columns."""
-        self.process_table.add_columns(
-            "PID", "Name", "CPU %", "Memory %", "Status", "User", "Started"
-        )
+        self._column_keys = self.process_table.add_columns(*self.COLUMNS)
         self.update_process_list()
 
     def update_process_list(self) -> None:
-        """Update the process list display."""
+        """Update the process list display.
+
+        Rows are keyed by PID and patched in place: exited processes are
+        removed, new ones appended and only changed cells rewritten, so the
+        cursor and scroll position survive a refresh. Row order is not
+        kept sorted: PIDs that appear after the first refresh are appended
+        at the bottom of the table.
+        """
         try:
             processes = self.monitor.get_process_list()
-            self.process_table.clear()
+            table = self.process_table
+            rows = {}
             for pid, process in processes.items():
                 formatted = self.monitor.format_process_data(process)
-                self.process_table.add_row(
-                    formatted["PID"],
-                    formatted["Name"],
-                    formatted["CPU %"],
-                    formatted["Memory %"],
-                    formatted["Status"],
-                    formatted["User"],
-                    formatted["Started"],
-                    key=str(pid)
-                )
+                rows[str(pid)] = [formatted[column] for column in self.COLUMNS]
+
+            # Drop processes that have exited
+            for row_key in [key for key in table.rows if key.value not in rows]:
+                table.remove_row(row_key)
+
+            for key, values in rows.items():
+                if key not in table.rows:
+                    table.add_row(*values, key=key)
+                    continue
+                current = table.get_row(key)
+                for column_key, old, new in zip(self._column_keys, current, values):
+                    if old != new:
+                        table.update_cell(key, column_key, new)
         except Exception as e:
             logger.error(f"Failed to update process list: {e}")
 
-class ResourceMonitorWidget(Static):
-    """Widget for displaying system resource usage."""
-
-    def __init__(self, monitor: ProcessMonitor):
-        super().__init__()
-        self.monitor = monitor
-        self.resources_display = Static()
-
-    def compose(self) -> ComposeResult:
-        """Create child widgets."""
-        yield self.resources_display
-
-    def update_resources(self) -> None:
-        """Update the resource usage display."""
-        try:
-            resources = self.monitor.get_system_resources()
-            formatted = self.monitor.format_resource_data(resources)
-            
-            content = Text()
-            for key, value in formatted.items():
-                content.append(f"{key}: ", style="bold green")
-                content.append(f"{value}\n", style="bright_green")
-            
-            self.resources_display.update(content)
-        except Exception as e:
-            logger.error(f"Failed to update resource monitor: {e}")
-
 class ProcessDashboard(App):
     """Main application class for the Process Dashboard TUI."""
     
@@ -495,12 +406,7 @@ class ProcessDashboard(App):
                 self.config.updates.process_update_interval,
                 self.update_process_list
             )
-            
-            # Start resource monitoring updates
-            self.set_interval(
-                self.config.updates.resource_update_interval,
-                self.update_resource_monitor
-            )
+            # ResourceMonitor schedules its own updates once mounted
         except Exception as e:
             logger.error(f"Failed to initialize monitoring: {e}")
 
@@ -535,9 +441,10 @@ class ProcessDashboard(App):
     def update_resource_monitor(self) -> None:
         """Update the resource monitor display."""
         try:
-            resource_monitor = self.query_one(ResourceMonitorWidget)
+            resource_monitor = self.query_one(ResourceMonitor)
             if resource_monitor is not None:
-                resource_monitor.update_resources()
+                resource_monitor.update_cpu()
+                resource_monitor.update_memory()
         except Exception as e:
             logger.error(f"Failed to update resource monitor: {e}")
 
@@ -558,25 +465,14 @@ class ProcessDashboard(App):
         except Exception as e:
             logger.error(f"Failed to refresh display: {e}")
 
-    async def on_key(self, message) -> None:
-        """Handle key events.
-        
-        Args:
-            message: The key message event.
-        """
-        try:
-            if message.key == "q":
-                await self.action_quit()
-            elif message.key == "r":
-                self.action_refresh()
-            elif message.key == "c":
-                self.action_toggle_config()
-        except Exception as e:
-            logger.error(f"Failed to handle key event: {e}")
-            await self.action_quit()
-
 def main() -> None:
     """Entry point for the application."""
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[RichHandler(rich_tracebacks=True)]
+    )
     app = ProcessDashboard()
     app.run()
 
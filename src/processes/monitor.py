@@ -9,22 +9,27 @@ This module provides comprehensive process monitoring capabilities including:
 """
 
 import logging
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional, Set, Tuple, TypedDict, Union, Callable
+from typing import (
+    ClassVar, Deque, Dict, List, Literal, Optional, Set, Tuple, TypedDict, Union, Callable
+)
 from datetime import datetime, timedelta
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import defaultdict, deque
+from functools import lru_cache
 import psutil
 from psutil._common import bytes2human
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Logging is configured by the application entry point (main.py)
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=4096)
+def _format_start_time(create_time: datetime) -> str:
+    """Format a process start time; memoized since it never changes for a PID."""
+    return create_time.strftime("%Y-%m-%d %H:%M:%S")
+
 class ProcessInfo(TypedDict):
     """Type definition for process information."""
     pid: int
@@ -54,9 +59,14 @@ class SystemResources(TypedDict):
     io_counters: Dict[str, int]
     load_avg: Tuple[float, float, float]
 
+# SystemResources keys that hold a percentage checked against a threshold
+SystemPercentKey = Literal['cpu_percent', 'memory_percent', 'swap_percent']
+
 @dataclass
 class ProcessHistoryEntry:
     """Process history data structure."""
+    __slots__ = ('timestamp', 'cpu_percent', 'memory_percent', 'status')
+
     timestamp: datetime
     cpu_percent: float
     memory_percent: float
@@ -83,14 +93,22 @@ class ProcessMonitor:
         """
         self.history_interval = history_interval
         self.history_length = history_length
-        self.process_history: Dict[int, List[ProcessHistoryEntry]] = defaultdict(list)
+        self.process_history: Dict[int, Deque[ProcessHistoryEntry]] = defaultdict(deque)
         self.last_history_update = datetime.now()
-        self._cpu_percent = psutil.cpu_percent(interval=0.1)  # Initial CPU reading
+        # Prime the system-wide CPU counter so later non-blocking reads
+        # measure from here instead of sleeping for a sample window
+        self._cpu_percent = psutil.cpu_percent(interval=None)
         
         # Cache for process tree relationships
         self._process_tree_cache: Dict[int, Set[int]] = {}
-        self._last_tree_update = datetime.now()
-        self._tree_cache_ttl = timedelta(seconds=5)  # Cache TTL
+        self._last_tree_update = time.monotonic()
+        self._tree_cache_ttl = 5.0  # Cache TTL in seconds
+        
+        # Cache for per-mount disk usage, which changes slowly but costs a
+        # statvfs per mount point (and can stall on network filesystems)
+        self._disk_usage_cache: Dict[str, Dict[str, Union[int, float]]] = {}
+        self._disk_usage_time: Optional[float] = None
+        self._disk_usage_ttl = 5.0  # Cache TTL in seconds
         
         logger.info("ProcessMonitor initialized with %ds history interval", history_interval)
 
@@ -106,33 +124,62 @@ class ProcessMonitor:
         """
         try:
             processes: Dict[int, ProcessInfo] = {}
-            
-            # Update history if needed
-            self._update_history_if_needed()
+            history_entries: Dict[int, ProcessHistoryEntry] = {}
+            parent_pids: Dict[int, int] = {}
+            now = datetime.now()
+            # Only build history entries on ticks where they will be recorded
+            history_due = self._history_due(now)
             
             # Collect current CPU percentages
             for proc in psutil.process_iter(['pid', 'name', 'status']):
                 try:
                     with proc.oneshot():
                         pid = proc.pid
+                        status = proc.status()
+                        cpu_percent = proc.cpu_percent()
+                        memory_percent = proc.memory_percent()
+                        # Sample history and the parent before the fields
+                        # below, which are often denied for other users'
+                        # processes
+                        parent_pids[pid] = proc.ppid()
+                        if history_due:
+                            history_entries[pid] = ProcessHistoryEntry(
+                                timestamp=now,
+                                cpu_percent=cpu_percent or 0.0,  # Handle None
+                                memory_percent=memory_percent or 0.0,  # Handle None
+                                status=status
+                            )
                         processes[pid] = ProcessInfo(
                             pid=pid,
                             name=proc.name(),
-                            status=proc.status(),
-                            cpu_percent=proc.cpu_percent(),
-                            memory_percent=proc.memory_percent(),
+                            status=status,
+                            cpu_percent=cpu_percent,
+                            memory_percent=memory_percent,
                             memory_info=proc.memory_info()._asdict(),
                             username=proc.username(),
                             create_time=datetime.fromtimestamp(proc.create_time()),
                             num_threads=proc.num_threads(),
-                            parent_pid=proc.ppid(),
-                            children=[child.pid for child in proc.children()],
+                            parent_pid=parent_pids[pid],
+                            children=[],
                             cmdline=proc.cmdline(),
                             cwd=proc.cwd()
                         )
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess) as e:
                     logger.debug("Skipping process %d: %s", pid, str(e))
                     continue
+
+            # Link children from parent PIDs in a single pass; Process.children()
+            # rescans the whole process table on every call. Every scanned PID
+            # is linked, including children whose own details were denied.
+            for pid, parent_pid in parent_pids.items():
+                parent = processes.get(parent_pid)
+                if parent is not None and parent_pid != pid:
+                    parent["children"].append(pid)
+            
+            # Update history if needed, reusing this scan rather than
+            # scanning (and resetting cpu_percent on) every process again
+            if history_due:
+                self._update_history_if_needed(history_entries)
                 
             return processes
         except Exception as e:
@@ -159,7 +206,7 @@ class ProcessMonitor:
             process trees. The cache is automatically cleaned up based on TTL and
             process existence.
         """
-        now = datetime.now()
+        now = time.monotonic()
         
         # Check cache first
         if pid in self._process_tree_cache:
@@ -249,9 +296,6 @@ class ProcessMonitor:
         2. Have expired based on the cache TTL
         3. Have invalid data
         """
-        now = datetime.now()
-        expired = now - self._tree_cache_ttl
-        
         # Create new cache with only valid entries
         valid_cache: Dict[int, Set[int]] = {}
         
@@ -287,14 +331,12 @@ class ProcessMonitor:
             OSError: If unable to collect system information
         """
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)  # Since previous call
             virtual_memory = psutil.virtual_memory()
             swap = psutil.swap_memory()
-            disk_usage = {
-                disk.mountpoint: psutil.disk_usage(disk.mountpoint)._asdict()
-                for disk in psutil.disk_partitions(all=False)
-            }
-            io_counters = psutil.disk_io_counters()._asdict() if psutil.disk_io_counters() else {}
+            disk_usage = self._get_disk_usage()
+            disk_io = psutil.disk_io_counters()
+            io_counters = disk_io._asdict() if disk_io else {}
             
             return SystemResources(
                 cpu_percent=cpu_percent,
@@ -312,6 +354,27 @@ class ProcessMonitor:
             logger.error("Failed to get system resources: %s", str(e))
             raise OSError(f"Failed to collect system information: {str(e)}")
 
+    def _get_disk_usage(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """
+        Get usage for each mounted partition, cached for a few seconds.
+
+        Returns:
+            Dict mapping mount points to disk usage information
+        """
+        now = time.monotonic()
+        if (self._disk_usage_time is None
+                or now - self._disk_usage_time >= self._disk_usage_ttl):
+            self._disk_usage_cache = {
+                disk.mountpoint: psutil.disk_usage(disk.mountpoint)._asdict()
+                for disk in psutil.disk_partitions(all=False)
+            }
+            self._disk_usage_time = now
+        # Copy so callers mutating the result cannot corrupt the cache
+        return {
+            mountpoint: dict(usage)
+            for mountpoint, usage in self._disk_usage_cache.items()
+        }
+
     def get_process_history(self, pid: int) -> List[ProcessHistoryEntry]:
         """
         Get historical data for a specific process.
@@ -326,93 +389,87 @@ class ProcessMonitor:
             KeyError: If no history exists for the process
         """
         try:
-            history = self.process_history.get(pid, [])
+            history = self.process_history.get(pid)
             if not history:
                 raise KeyError(f"No history found for PID {pid}")
             
             # Clean old entries
             cutoff_time = datetime.now() - timedelta(seconds=self.history_length)
-            history = [entry for entry in history if entry.timestamp > cutoff_time]
-            self.process_history[pid] = history
+            self._trim_history(history, cutoff_time)
             
-            return history
+            return list(history)
         except Exception as e:
             logger.error("Failed to get process history for PID %d: %s", pid, str(e))
             raise
 
-    def _update_history_if_needed(self) -> None:
+    def _history_due(self, now: datetime) -> bool:
+        """
+        Check whether the history interval has passed since the last update.
+
+        Args:
+            now: Current time
+
+        Returns:
+            True if a new history entry should be recorded
+        """
+        time_since_update = (now - self.last_history_update).total_seconds()
+        return time_since_update >= self.history_interval
+
+    @staticmethod
+    def _trim_history(history: Deque[ProcessHistoryEntry], cutoff_time: datetime) -> None:
+        """
+        Drop entries at or before the cutoff from the front of a history.
+
+        Entries are appended in time order, so expired ones are always at
+        the left end and trimming stops at the first entry still in range.
+
+        Args:
+            history: History for a single process
+            cutoff_time: Oldest timestamp to discard
+        """
+        while history and history[0].timestamp <= cutoff_time:
+            history.popleft()
+
+    def _update_history_if_needed(
+        self, new_entries: Dict[int, ProcessHistoryEntry]
+    ) -> None:
         """
         Update process history if enough time has passed since last update.
         
         This method performs two main tasks:
-        1. Collects current process statistics for history tracking
+        1. Records the latest process statistics for history tracking
         2. Cleans up old history entries that exceed the history length
         
         The method uses proper exception handling and ensures atomic updates
         to prevent data corruption during concurrent access.
+
+        Args:
+            new_entries: History entry per PID sampled by get_process_list
         """
         now = datetime.now()
-        time_since_update = (now - self.last_history_update).total_seconds()
         
-        if time_since_update >= self.history_interval:
+        if self._history_due(now):
             try:
-                # Create temporary storage for new history entries
-                new_entries: Dict[int, ProcessHistoryEntry] = {}
-                
-                # Collect current process information
-                for proc in psutil.process_iter(['pid', 'name', 'status']):
-                    try:
-                        # Use oneshot() to get consistent readings
-                        with proc.oneshot():
-                            if not proc.is_running():
-                                continue
-                                
-                            history_entry = ProcessHistoryEntry(
-                                timestamp=now,
-                                cpu_percent=proc.cpu_percent() or 0.0,  # Handle None
-                                memory_percent=proc.memory_percent() or 0.0,  # Handle None
-                                status=proc.status()
-                            )
-                            new_entries[proc.pid] = history_entry
-                            
-                    except psutil.NoSuchProcess:
-                        logger.debug("Process disappeared while collecting history")
-                        continue
-                    except psutil.AccessDenied:
-                        logger.debug("Access denied while collecting process history")
-                        continue
-                    except psutil.ZombieProcess:
-                        logger.debug("Skipping zombie process in history collection")
-                        continue
-                    except Exception as e:
-                        logger.error("Error collecting process history: %s", str(e))
-                        continue
-                
                 # Calculate cutoff time for old entries
                 cutoff_time = now - timedelta(seconds=self.history_length)
                 
                 # Update history with new entries and clean old ones
                 for pid in list(self.process_history.keys()):
-                    # Clean old entries
-                    current_history = [
-                        entry for entry in self.process_history[pid]
-                        if entry.timestamp > cutoff_time
-                    ]
+                    current_history = self.process_history[pid]
+                    self._trim_history(current_history, cutoff_time)
                     
                     # Add new entry if it exists
                     if pid in new_entries:
                         current_history.append(new_entries[pid])
                     
-                    # Update or remove history for this PID
-                    if current_history:
-                        self.process_history[pid] = current_history
-                    else:
+                    # Remove history for PIDs with nothing left
+                    if not current_history:
                         del self.process_history[pid]
                 
                 # Add history for new processes
                 for pid, entry in new_entries.items():
                     if pid not in self.process_history:
-                        self.process_history[pid] = [entry]
+                        self.process_history[pid] = deque([entry])
                 
                 self.last_history_update = now
                 
@@ -438,7 +495,7 @@ class ProcessMonitor:
                 "Memory %": f"{process['memory_percent']:.1f}%",
                 "Status": process["status"],
                 "User": process["username"],
-                "Started": process["create_time"].strftime("%Y-%m-%d %H:%M:%S")
+                "Started": _format_start_time(process["create_time"])
             }
         except Exception as e:
             logger.error("Failed to format process data: %s", str(e))
@@ -551,6 +608,13 @@ class ProcessController:
 
 class AsyncMonitor:
     """Provides asynchronous monitoring capabilities with callbacks."""
+
+    # System-wide resources checked against thresholds: (resource key, label)
+    SYSTEM_CHECKS: ClassVar[Tuple[Tuple[SystemPercentKey, str], ...]] = (
+        ('cpu_percent', 'CPU'),
+        ('memory_percent', 'memory'),
+        ('swap_percent', 'swap'),
+    )
     
     def __init__(self, monitor: ProcessMonitor, update_interval: float = 1.0):
         """
@@ -564,6 +628,7 @@ class AsyncMonitor:
         self.update_interval = update_interval
         self.running = False
         self.logger = logging.getLogger(__name__)
+        self._stop_event = threading.Event()
         self._executor = ThreadPoolExecutor(max_workers=2)
         self._callbacks: List[Callable[[Dict[int, ProcessInfo], SystemResources], None]] = []
         
@@ -574,6 +639,10 @@ class AsyncMonitor:
             'swap_percent': 80.0,
             'disk_percent': 90.0
         }
+        
+        # Breaches reported on the last check, so a sustained breach is
+        # logged once rather than on every tick
+        self._breached: Set[Tuple[str, Union[str, int]]] = set()
     
     def add_callback(self, callback: Callable[[Dict[int, ProcessInfo], SystemResources], None]) -> None:
         """
@@ -600,11 +669,13 @@ class AsyncMonitor:
             return
             
         self.running = True
+        self._stop_event.clear()
         self._executor.submit(self._monitor_loop)
     
     def stop(self) -> None:
         """Stop the monitoring loop."""
         self.running = False
+        self._stop_event.set()  # Wake the loop instead of waiting out the interval
         self._executor.shutdown(wait=False)
     
     def _monitor_loop(self) -> None:
@@ -624,58 +695,78 @@ class AsyncMonitor:
                     except Exception as e:
                         self.logger.error(f"Error in monitoring callback: {e}")
                 
-                time.sleep(self.update_interval)
+                self._stop_event.wait(self.update_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(1)  # Prevent tight loop on persistent errors
+                self._stop_event.wait(1)  # Prevent tight loop on persistent errors
     
     def _check_thresholds(self, processes: Dict[int, ProcessInfo], 
                          resources: SystemResources) -> None:
         """
         Check resource usage against thresholds and log alerts.
         
+        Each breach is logged when it starts; it is logged again only after
+        the value has dropped back under its threshold.
+        
         Args:
             processes: Current process information
             resources: Current system resources
         """
-        # System-wide checks
-        if resources['cpu_percent'] > self.thresholds['cpu_percent']:
-            self.logger.warning(
-                f"High CPU usage: {resources['cpu_percent']:.1f}% "
-                f"(threshold: {self.thresholds['cpu_percent']}%)"
-            )
-        
-        if resources['memory_percent'] > self.thresholds['memory_percent']:
-            self.logger.warning(
-                f"High memory usage: {resources['memory_percent']:.1f}% "
-                f"(threshold: {self.thresholds['memory_percent']}%)"
-            )
+        breached: Set[Tuple[str, Union[str, int]]] = set()
         
-        if resources['swap_percent'] > self.thresholds['swap_percent']:
-            self.logger.warning(
-                f"High swap usage: {resources['swap_percent']:.1f}% "
-                f"(threshold: {self.thresholds['swap_percent']}%)"
-            )
+        # System-wide checks
+        for key, label in self.SYSTEM_CHECKS:
+            threshold = self.thresholds[key]
+            if resources[key] > threshold:
+                self._alert(
+                    breached, ('system', key),
+                    f"High {label} usage: {resources[key]:.1f}% "
+                    f"(threshold: {threshold}%)"
+                )
         
         # Check individual disk usage
+        disk_limit = self.thresholds['disk_percent']
         for mount, usage in resources['disk_usage'].items():
-            if usage['percent'] > self.thresholds['disk_percent']:
-                self.logger.warning(
+            if usage['percent'] > disk_limit:
+                self._alert(
+                    breached, ('disk', mount),
                     f"High disk usage on {mount}: {usage['percent']:.1f}% "
-                    f"(threshold: {self.thresholds['disk_percent']}%)"
+                    f"(threshold: {disk_limit}%)"
                 )
         
-        # Process-specific checks
+        # Process-specific checks; thresholds are bound once since this loop
+        # runs over every process on every tick
+        cpu_limit = self.thresholds['cpu_percent']
+        memory_limit = self.thresholds['memory_percent']
         for pid, proc in processes.items():
-            if proc['cpu_percent'] > self.thresholds['cpu_percent']:
-                self.logger.warning(
+            if proc['cpu_percent'] > cpu_limit:
+                self._alert(
+                    breached, ('cpu', pid),
                     f"Process {pid} ({proc['name']}) high CPU usage: "
                     f"{proc['cpu_percent']:.1f}%"
                 )
             
-            if proc['memory_percent'] > self.thresholds['memory_percent']:
-                self.logger.warning(
+            if proc['memory_percent'] > memory_limit:
+                self._alert(
+                    breached, ('memory', pid),
                     f"Process {pid} ({proc['name']}) high memory usage: "
                     f"{proc['memory_percent']:.1f}%"
                 )
+        
+        # Anything no longer over its threshold (or gone) can alert again
+        self._breached = breached
+    
+    def _alert(self, breached: Set[Tuple[str, Union[str, int]]],
+               key: Tuple[str, Union[str, int]], message: str) -> None:
+        """
+        Record a threshold breach, logging it only when it is new.
+        
+        Args:
+            breached: Breaches seen during the current check
+            key: Identifies the resource and check that breached
+            message: Warning to log
+        """
+        breached.add(key)
+        if key not in self._breached:
+            self.logger.warning(message)
@@ -7,9 +7,11 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
 import os
+import stat
 import pwd
 import grp
 from dataclasses import dataclass
+from functools import lru_cache
 
 from textual.app import ComposeResult
 from textual.containers import Container, Horizontal, Vertical, Grid
@@ -30,9 +32,30 @@ from rich.table import Table
 from rich import box
 from rich.style import Style
 
+@lru_cache(maxsize=256)
+def _owner_name(uid: int) -> str:
+    """Resolve a user name, falling back to the numeric ID."""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+@lru_cache(maxsize=256)
+def _group_name(gid: int) -> str:
+    """Resolve a group name, falling back to the numeric ID."""
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
 @dataclass
 class FileInfo:
     """Information about a file or directory."""
+    __slots__ = (
+        'path', 'name', 'size', 'modified', 'owner',
+        'group', 'permissions', 'is_dir', 'icon'
+    )
+
     path: Path
     name: str
     size: int
@@ -56,6 +79,26 @@ class SortBy(Enum):
     MODIFIED = "Modified"
     TYPE = "Type"
 
+# Sort keys per field; directories sort ahead of files (after them when reversed)
+def _name_key(f: FileInfo) -> tuple:
+    return (not f.is_dir, f.name.lower())
+
+def _size_key(f: FileInfo) -> tuple:
+    return (not f.is_dir, f.size)
+
+def _modified_key(f: FileInfo) -> tuple:
+    return (not f.is_dir, f.modified)
+
+def _type_key(f: FileInfo) -> tuple:
+    return (not f.is_dir, f.path.suffix.lower())
+
+SORT_KEYS: Dict[SortBy, Callable[[FileInfo], tuple]] = {
+    SortBy.NAME: _name_key,
+    SortBy.SIZE: _size_key,
+    SortBy.MODIFIED: _modified_key,
+    SortBy.TYPE: _type_key,
+}
+
 class FileBrowser(Container):
     """Matrix-themed file browser widget with multiple view modes."""
     
@@ -142,6 +185,7 @@ class FileBrowser(Container):
         super().__init__()
         self._files: List[FileInfo] = []
         self._filtered_files: List[FileInfo] = []
+        self._icon_files: Dict[str, FileInfo] = {}  # Icon widget ID -> file
 
     def compose(self) -> ComposeResult:
         """Create child widgets."""
@@ -175,34 +219,33 @@ class FileBrowser(Container):
         # Status bar
         yield Static("Ready", id="status-bar")
 
-    def on_mount(self) -> None:
-        """Handle widget mount."""
-        self.load_directory()
-
     def load_directory(self) -> None:
         """Load the current directory contents."""
         try:
             self._files = []
             self._filtered_files = []
-            for entry in self.current_path.iterdir():
-                try:
-                    stat = entry.stat()
-                    self._files.append(FileInfo(
-                        path=entry,
-                        name=entry.name,
-                        size=stat.st_size,
-                        modified=datetime.fromtimestamp(stat.st_mtime),
-                        owner=pwd.getpwuid(stat.st_uid).pw_name,
-                        group=grp.getgrgid(stat.st_gid).gr_name,
-                        permissions=self._get_permissions(stat.st_mode),
-                        is_dir=entry.is_dir(),
-                        icon="📁" if entry.is_dir() else "📄"
-                    ))
-                except (PermissionError, FileNotFoundError):
-                    continue
-
-            self.sort_files()
-            self.filter_files()
+            # scandir reports the entry type from the directory listing, so
+            # each entry costs a single stat call
+            with os.scandir(self.current_path) as entries:
+                for entry in entries:
+                    try:
+                        st = entry.stat()
+                        is_dir = entry.is_dir()
+                        self._files.append(FileInfo(
+                            path=Path(entry.path),
+                            name=entry.name,
+                            size=st.st_size,
+                            modified=datetime.fromtimestamp(st.st_mtime),
+                            owner=_owner_name(st.st_uid),
+                            group=_group_name(st.st_gid),
+                            permissions=self._get_permissions(st.st_mode),
+                            is_dir=is_dir,
+                            icon="📁" if is_dir else "📄"
+                        ))
+                    except (PermissionError, FileNotFoundError):
+                        continue
+
+            self.sort_files()  # Also applies the filter
             self.refresh_view()
             self._update_status()
 
@@ -211,28 +254,11 @@ class FileBrowser(Container):
 
     def _get_permissions(self, mode: int) -> str:
         """Convert mode bits to string representation."""
-        perms = ""
-        for who in "rwx":
-            perms += who if mode & getattr(os, f"S_I{who.upper()}USR") else "-"
-        for who in "rwx":
-            perms += who if mode & getattr(os, f"S_I{who.upper()}GRP") else "-"
-        for who in "rwx":
-            perms += who if mode & getattr(os, f"S_I{who.upper()}OTH") else "-"
-        return perms
+        return stat.filemode(mode)[1:]  # Drop the file type character
 
     def sort_files(self) -> None:
         """Sort files according to current sort settings."""
-        reverse = self.sort_reverse
-        if self.sort_by == SortBy.NAME:
-            key = lambda f: (not f.is_dir, f.name.lower())
-        elif self.sort_by == SortBy.SIZE:
-            key = lambda f: (not f.is_dir, f.size)
-        elif self.sort_by == SortBy.MODIFIED:
-            key = lambda f: (not f.is_dir, f.modified)
-        else:  # TYPE
-            key = lambda f: (not f.is_dir, f.path.suffix.lower())
-
-        self._files.sort(key=key, reverse=reverse)
+        self._files.sort(key=SORT_KEYS[self.sort_by], reverse=self.sort_reverse)
         self.filter_files()
 
     def filter_files(self) -> None:
@@ -274,11 +300,14 @@ class FileBrowser(Container):
         
         elif self.view_mode == ViewMode.ICONS:
             grid = Grid(classes="file-grid")
+            self._icon_files = {}
             for file in files:
+                icon_id = f"file-{hash(str(file.path))}"
+                self._icon_files[icon_id] = file
                 icon = Static(
                     f"{file.icon}\n{file.name}",
                     classes="file-icon",
-                    id=f"file-{hash(str(file.path))}"
+                    id=icon_id
                 )
                 grid.mount(icon)
             content.mount(grid)
@@ -328,14 +357,12 @@ class FileBrowser(Container):
         """Handle entry selection."""
         if self.selected_path and self.selected_path.is_dir():
             self.current_path = self.selected_path
-            self.load_directory()
 
     def action_parent_directory(self) -> None:
         """Navigate to parent directory."""
         parent = self.current_path.parent
         if parent != self.current_path:
             self.current_path = parent
-            self.load_directory()
 
     async def on_click(self, event: Click) -> None:
         """Handle click events."""
@@ -343,22 +370,17 @@ class FileBrowser(Container):
             self.action_parent_directory()
         elif event.target.id == "home-dir":
             self.current_path = Path.home()
-            self.load_directory()
         elif event.target.id == "refresh":
             self.load_directory()
         elif event.target.id == "sort-direction":
             self.sort_reverse = not self.sort_reverse
             self.sort_files()
-        elif event.target.id.startswith("file-"):
+        elif event.target.id in self._icon_files:
             # Handle file selection
-            file_id = event.target.id
-            for file in self._filtered_files:
-                if f"file-{hash(str(file.path))}" == file_id:
-                    self.selected_path = file.path
-                    if file.is_dir:
-                        self.current_path = file.path
-                        self.load_directory()
-                    break
+            file = self._icon_files[event.target.id]
+            self.selected_path = file.path
+            if file.is_dir:
+                self.current_path = file.path
 
     async def watch_view_mode(self, new_value: ViewMode) -> None:
         """Handle view mode changes."""
@@ -373,7 +395,11 @@ class FileBrowser(Container):
         self.filter_files()
 
     async def watch_current_path(self, new_value: Path) -> None:
-        """Handle current path changes."""
+        """Handle current path changes.
+
+        This is the single place a directory is (re)loaded on navigation; it
+        also runs once on mount for the initial path.
+        """
         self.load_directory()
 
 
@@ -8,9 +8,10 @@ from textual.geometry import Size
 from textual.widget import Widget
 from textual.message import Message
 from rich.segment import Segment
-from rich.style import Style
 import asyncio
 
+from ui.matrix_style import green_style
+
 MATRIX_CHARS = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ1234567890"
 
 class RainDrop:
@@ -81,8 +82,9 @@ class MatrixBackground(Widget):
             for i, (char, intensity) in enumerate(zip(drop.chars, drop.intensities)):
                 y = int(drop.y) - i
                 if 0 <= y < height:
-                    green = int(255 * intensity)
-                    style = Style(color=f"rgb(0,{green},0)", opacity=0.5)
+                    # Rich styles have no opacity; on the black background
+                    # half opacity is simply half the green level
+                    style = green_style(int(255 * intensity) // 2)
                     canvas[y][drop.x] = Segment(char, style)
 
         return canvas
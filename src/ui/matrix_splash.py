@@ -4,16 +4,17 @@ Matrix-style splash screen with digital rain effect.
 
 import asyncio
 import random
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from textual.widget import Widget
 from textual.message import Message
 from textual.geometry import Size
 from rich.console import Console, ConsoleOptions, RenderResult
 from rich.segment import Segment
-from rich.style import Style
 from rich import box
 from datetime import datetime
 
+from ui.matrix_style import green_style
+
 # Matrix rain characters (mix of Katakana and other symbols)
 MATRIX_CHARS = "ｱｲｳｴｵｶｷｸｹｺｻｼｽｾｿﾀﾁﾂﾃﾄﾅﾆﾇﾈﾉﾊﾋﾌﾍﾎﾏﾐﾑﾒﾓﾔﾕﾖﾗﾘﾙﾚﾛﾜﾝ1234567890"
 
@@ -147,34 +148,36 @@ class MatrixSplash(Widget):
         width = self.size.width
         height = self.size.height
 
-        # Create a blank canvas
-        canvas = [[" " for _ in range(width)] for _ in range(height)]
-        intensities = [[0.0 for _ in range(width)] for _ in range(height)]
-
         # Get overall opacity for fade effect
         elapsed = self.app.time - self.start_time
         opacity = self._get_opacity(elapsed)
 
-        # Render all raindrops
+        # Collect only the lit cells, keyed by row then column; most of the
+        # screen is blank, so there is no need for full-size grids
+        rows: Dict[int, Dict[int, Tuple[str, float]]] = {}
         for drop in self.raindrops:
+            if not 0 <= drop.x < width:
+                continue
             for y, char, intensity in drop.render():
-                if 0 <= y < height and 0 <= drop.x < width:
-                    canvas[y][drop.x] = char
-                    intensities[y][drop.x] = intensity * opacity
+                if 0 <= y < height:
+                    rows.setdefault(y, {})[drop.x] = (char, intensity * opacity)
 
-        # Convert to segments
+        # Convert to segments, emitting each blank run as a single segment
         segments = []
         for y in range(height):
             line_segments = []
-            for x in range(width):
-                intensity = intensities[y][x]
-                if intensity > 0:
-                    # Calculate color based on intensity
-                    green = int(255 * intensity)
-                    style = Style(color=f"rgb(0,{green},0)")
-                    line_segments.append(Segment(canvas[y][x], style))
-                else:
-                    line_segments.append(Segment(" "))
+            x = 0
+            for cell_x, (char, intensity) in sorted(rows.get(y, {}).items()):
+                if intensity <= 0:
+                    continue
+                if cell_x > x:
+                    line_segments.append(Segment(" " * (cell_x - x)))
+                # Calculate color based on intensity
+                style = green_style(int(255 * intensity))
+                line_segments.append(Segment(char, style))
+                x = cell_x + 1
+            if x < width:
+                line_segments.append(Segment(" " * (width - x)))
             segments.append(line_segments)
             segments.append(Segment.line())
 
@@ -0,0 +1,11 @@
+"""
+Shared styles for the matrix rain effects.
+"""
+
+from functools import lru_cache
+from rich.style import Style
+
+@lru_cache(maxsize=256)
+def green_style(green: int) -> Style:
+    """Get the text style for a green level (0-255)."""
+    return Style(color=f"rgb(0,{green},0)")
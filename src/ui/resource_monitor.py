@@ -11,10 +11,12 @@ This module provides a Textual widget for monitoring system resources including:
 All visualizations use a matrix-inspired theme with neon green text and effects.
 """
 
+import heapq
 import time
-from typing import Dict, List, Optional, Deque
+from typing import Dict, List, Optional, Deque, Tuple
 from datetime import datetime
 from collections import deque
+from itertools import accumulate
 import psutil
 from dataclasses import dataclass
 
@@ -35,6 +37,14 @@ SPARKLINE_WIDTH = 50  # Width of sparkline graphs
 MAX_HISTORY_POINTS = 120  # 2 minutes at 1s intervals
 MAX_PROCESSES = 50  # Maximum number of processes to display
 
+# Per-device graph series for the I/O sections: (series key, label)
+NET_SERIES = (('sent', 'Upload'), ('received', 'Download'))
+DISK_SERIES = (('read', 'Read'), ('write', 'Write'))
+
+# Rate table headers for the I/O sections
+NET_COLUMNS = ("Interface", "Upload", "Download", "Total", "Packets Up", "Packets Down")
+DISK_COLUMNS = ("Device", "Read", "Write", "Busy Time")
+
 class TimeSeriesGraph:
     """Time series data visualization with matrix theme."""
     
@@ -43,11 +53,17 @@ class TimeSeriesGraph:
         self.values: Deque[float] = deque(maxlen=max_points)
         self.timestamps: Deque[datetime] = deque(maxlen=max_points)
         
-    def add_point(self, value: float) -> None:
-        """Add a new data point."""
+    def add_point(self, value: float, timestamp: Optional[datetime] = None) -> None:
+        """Add a new data point.
+        
+        Args:
+            value: Value to record, clamped to 0-1.
+            timestamp: Sample time; callers updating several graphs in one
+                tick pass a shared value. Defaults to now.
+        """
         normalized = min(1.0, max(0.0, value))  # Clamp to 0-1
         self.values.append(normalized)
-        self.timestamps.append(datetime.now())
+        self.timestamps.append(datetime.now() if timestamp is None else timestamp)
         
     def get_sparkline(self, width: int = SPARKLINE_WIDTH) -> Text:
         """Get sparkline representation of the data.
@@ -69,11 +85,16 @@ class TimeSeriesGraph:
         if len(values) < width:
             values.extend([0.0] * (width - len(values)))
         elif len(values) > width:
-            chunk_size = len(values) // width
+            # Average into `width` buckets spanning the whole history, using
+            # prefix sums so each bucket costs O(1) and the newest points are
+            # never dropped
+            count = len(values)
+            sums = list(accumulate(values, initial=0.0))
+            bounds = [i * count // width for i in range(width + 1)]
             values = [
-                sum(values[i:i + chunk_size]) / chunk_size
-                for i in range(0, len(values), chunk_size)
-            ][:width]
+                (sums[end] - sums[start]) / (end - start)
+                for start, end in zip(bounds, bounds[1:])
+            ]
         
         # Create sparkline with gradient colors
         result = Text()
@@ -185,6 +206,7 @@ class ResourceMonitor(Container):
         # Initialize all monitoring components
         self.cpu_total = TimeSeriesGraph()
         self.cpu_cores: Dict[int, TimeSeriesGraph] = {}
+        self.core_labels: List[Static] = []
         self.memory_usage = TimeSeriesGraph()
         self.swap_usage = TimeSeriesGraph()
         
@@ -213,6 +235,7 @@ class ResourceMonitor(Container):
                 with Container(id="cpu-total", classes="graph-container"):
                     yield Static("Total CPU", classes="stat-label")
                     yield ProgressBar(classes="progress-bar")
+                    yield Static(classes="graph-label")
                 yield Container(id="cpu-cores", classes="graph-container")
         
         # Memory Usage Section
@@ -222,9 +245,11 @@ class ResourceMonitor(Container):
                 with Container(id="memory-usage", classes="graph-container"):
                     yield Static("RAM", classes="stat-label")
                     yield ProgressBar(classes="progress-bar")
+                    yield Static(classes="graph-label")
                 with Container(id="swap-usage", classes="graph-container"):
                     yield Static("Swap", classes="stat-label")
                     yield ProgressBar(classes="progress-bar")
+                    yield Static(classes="graph-label")
         
         # Network Activity Section
         with Container(classes="monitor-section"):
@@ -232,7 +257,8 @@ class ResourceMonitor(Container):
             with Tabs():
                 yield TabPane("Graph View")
                 with Container(id="network-stats", classes="graph-container"):
-                    yield DataTable()
+                    yield DataTable(classes="io-table")
+                    yield Static(classes="io-graphs")
         
         # Disk I/O Section
         with Container(classes="monitor-section"):
@@ -240,7 +266,8 @@ class ResourceMonitor(Container):
             with Tabs():
                 yield TabPane("Graph View")
                 with Container(id="disk-stats", classes="graph-container"):
-                    yield DataTable()
+                    yield DataTable(classes="io-table")
+                    yield Static(classes="io-graphs")
         
         # Process List Section
         with Container(classes="monitor-section"):
@@ -256,17 +283,19 @@ class ResourceMonitor(Container):
         try:
             # Initialize network interface history
             for interface in psutil.net_if_stats():
-                self.net_stats[interface] = {
-                    'sent': TimeSeriesGraph(),
-                    'received': TimeSeriesGraph()
-                }
+                self.net_stats[interface] = self._new_graphs(NET_SERIES)
             
             # Initialize disk history
             for disk in psutil.disk_partitions():
-                self.disk_stats[disk.device] = {
-                    'read': TimeSeriesGraph(),
-                    'write': TimeSeriesGraph()
-                }
+                self.disk_stats[disk.device] = self._new_graphs(DISK_SERIES)
+            
+            # Initialize I/O rate tables
+            self.query_one("#network-stats .io-table", DataTable).add_columns(*NET_COLUMNS)
+            self.query_one("#disk-stats .io-table", DataTable).add_columns(*DISK_COLUMNS)
+            
+            # Prime CPU counters so the first tick reports real usage
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
             
             # Initialize process table
             process_table = self.query_one("#process-table", DataTable)
@@ -293,6 +322,44 @@ class ResourceMonitor(Container):
             bytes_ /= 1024
         return f"{bytes_:.1f}PB"
 
+    def _new_graphs(self, series: Tuple[Tuple[str, str], ...]) -> Dict[str, TimeSeriesGraph]:
+        """Create an empty graph for each (series key, label) pair."""
+        return {key: TimeSeriesGraph() for key, _ in series}
+
+    def _render_io_section(
+        self,
+        container_id: str,
+        rows: List[tuple],
+        history: Dict[str, Dict[str, TimeSeriesGraph]],
+        series: Tuple[Tuple[str, str], ...]
+    ) -> None:
+        """Refresh the rate table and per-device sparklines of an I/O section.
+
+        The table and graph widgets are created once in compose and updated
+        in place, so a tick does not tear down and remount the section.
+
+        Args:
+            container_id: ID of the section container
+            rows: Table rows of current rates
+            history: Graphs per device, keyed by series key
+            series: (series key, label) pairs drawn for each device
+        """
+        container = self.query_one(f"#{container_id}", Container)
+        table = container.query_one(".io-table", DataTable)
+        table.clear()
+        for row in rows:
+            table.add_row(*row)
+
+        # Graphs for each device
+        text = Text()
+        for device, graphs in history.items():
+            text.append(f"\n{device}\n", style="bold green")
+            for i, (key, label) in enumerate(series):
+                text.append(("\n" if i else "") + f"{label}: ", style="green")
+                text.append(graphs[key].get_sparkline())
+            text.append("\n")
+        container.query_one(".io-graphs", Static).update(text)
+
     def handle_error(self, error: Exception, component: str) -> None:
         """Handle errors with rate limiting.
         
@@ -319,8 +386,11 @@ class ResourceMonitor(Container):
         """Update CPU usage statistics."""
         try:
             # Get total CPU usage
-            total_percent = psutil.cpu_percent(interval=0.1)
-            self.cpu_total.add_point(total_percent / 100)
+            now = datetime.now()
+            # Non-blocking: usage since the previous tick, so the event loop
+            # never sleeps waiting for a sample
+            total_percent = psutil.cpu_percent(interval=None)
+            self.cpu_total.add_point(total_percent / 100, now)
             
             # Update total CPU display
             cpu_total = self.query_one("#cpu-total", Container)
@@ -333,23 +403,29 @@ class ResourceMonitor(Container):
                 text.append("Total CPU: ", style="green")
                 text.append(f"{total_percent:.1f}%\n", style="bold green")
                 text.append(self.cpu_total.get_sparkline())
-                cpu_total.mount(Static(text))
+                cpu_total.query_one(".graph-label", Static).update(text)
             
             # Update per-core CPU usage
             per_core = psutil.cpu_percent(percpu=True)
             cores_container = self.query_one("#cpu-cores", Container)
             if cores_container:
-                cores_container.remove_children()
+                # Mount one label per core the first time (or if the core
+                # count changes) and update them in place afterwards
+                if len(self.core_labels) != len(per_core):
+                    cores_container.remove_children()
+                    self.core_labels = [Static() for _ in per_core]
+                    cores_container.mount(*self.core_labels)
+                    
                 for i, usage in enumerate(per_core):
                     if i not in self.cpu_cores:
                         self.cpu_cores[i] = TimeSeriesGraph()
-                    self.cpu_cores[i].add_point(usage / 100)
+                    self.cpu_cores[i].add_point(usage / 100, now)
                     
                     text = Text()
                     text.append(f"Core {i}: ", style="green")
                     text.append(f"{usage:.1f}%\n", style="bold green")
                     text.append(self.cpu_cores[i].get_sparkline())
-                    cores_container.mount(Static(text))
+                    self.core_labels[i].update(text)
                     
         except Exception as e:
             self.handle_error(e, "CPU")
@@ -362,8 +438,9 @@ class ResourceMonitor(Container):
             swap = psutil.swap_memory()
             
             # Update memory graphs
-            self.memory_usage.add_point(memory.percent / 100)
-            self.swap_usage.add_point(swap.percent / 100)
+            now = datetime.now()
+            self.memory_usage.add_point(memory.percent / 100, now)
+            self.swap_usage.add_point(swap.percent / 100, now)
             
             # Update RAM display
             mem_container = self.query_one("#memory-usage", Container)
@@ -380,7 +457,7 @@ class ResourceMonitor(Container):
                     style="bold green"
                 )
                 text.append(self.memory_usage.get_sparkline())
-                mem_container.mount(Static(text))
+                mem_container.query_one(".graph-label", Static).update(text)
             
             # Update swap display
             swap_container = self.query_one("#swap-usage", Container)
@@ -397,7 +474,7 @@ class ResourceMonitor(Container):
                     style="bold green"
                 )
                 text.append(self.swap_usage.get_sparkline())
-                swap_container.mount(Static(text))
+                swap_container.query_one(".graph-label", Static).update(text)
                 
         except Exception as e:
             self.handle_error(e, "Memory")
@@ -417,21 +494,17 @@ class ResourceMonitor(Container):
             if interval < 0.1:  # Minimum update interval
                 return
                 
-            # Update network stats table
-            table = DataTable()
-            table.add_columns(
-                "Interface", "Upload", "Download", "Total",
-                "Packets Up", "Packets Down"
-            )
+            # Collect network stats rows
+            rows = []
+            now = datetime.now()
             
             for interface, stats in counters.items():
                 if interface not in self.net_stats:
-                    self.net_stats[interface] = {
-                        'sent': TimeSeriesGraph(),
-                        'received': TimeSeriesGraph()
-                    }
+                    self.net_stats[interface] = self._new_graphs(NET_SERIES)
                 
-                prev_stats = self.prev_net_counters[interface]
+                prev_stats = self.prev_net_counters.get(interface)
+                if prev_stats is None:  # Interface appeared since the last tick
+                    continue
                 
                 # Calculate rates
                 bytes_sent = (stats.bytes_sent - prev_stats.bytes_sent) / interval
@@ -440,34 +513,25 @@ class ResourceMonitor(Container):
                 packets_recv = (stats.packets_recv - prev_stats.packets_recv) / interval
                 
                 # Update graphs
-                self.net_stats[interface]['sent'].add_point(bytes_sent / 1_000_000)  # MB/s
-                self.net_stats[interface]['received'].add_point(bytes_recv / 1_000_000)  # MB/s
+                self.net_stats[interface]['sent'].add_point(bytes_sent / 1_000_000, now)  # MB/s
+                self.net_stats[interface]['received'].add_point(bytes_recv / 1_000_000, now)  # MB/s
                 
                 # Add table row
-                table.add_row(
+                rows.append((
                     interface,
                     f"↑ {self._format_size(bytes_sent)}/s",
                     f"↓ {self._format_size(bytes_recv)}/s",
                     self._format_size(stats.bytes_sent + stats.bytes_recv),
                     f"↑ {packets_sent:.0f}/s",
                     f"↓ {packets_recv:.0f}/s"
-                )
+                ))
             
+            # Drop history for interfaces that no longer exist (e.g. container veths)
+            for interface in self.net_stats.keys() - counters.keys():
+                del self.net_stats[interface]
+
             # Update display
-            net_stats = self.query_one("#network-stats", Container)
-            if net_stats:
-                net_stats.remove_children()
-                net_stats.mount(table)
-                
-                # Add graphs for each interface
-                for interface in counters.keys():
-                    text = Text()
-                    text.append(f"\n{interface}\n", style="bold green")
-                    text.append("Upload: ", style="green")
-                    text.append(self.net_stats[interface]['sent'].get_sparkline())
-                    text.append("\nDownload: ", style="green")
-                    text.append(self.net_stats[interface]['received'].get_sparkline())
-                    net_stats.mount(Static(text))
+            self._render_io_section("network-stats", rows, self.net_stats, NET_SERIES)
             
             self.prev_net_counters = counters
             self.net_update_time = current_time
@@ -490,26 +554,25 @@ class ResourceMonitor(Container):
             if interval < 0.1:  # Minimum update interval
                 return
                 
-            # Update disk stats table
-            table = DataTable()
-            table.add_columns("Device", "Read", "Write", "Busy Time")
+            # Collect disk stats rows
+            rows = []
+            now = datetime.now()
             
             for device, stats in counters.items():
                 if device not in self.disk_stats:
-                    self.disk_stats[device] = {
-                        'read': TimeSeriesGraph(),
-                        'write': TimeSeriesGraph()
-                    }
+                    self.disk_stats[device] = self._new_graphs(DISK_SERIES)
                 
-                prev_stats = self.prev_disk_counters[device]
+                prev_stats = self.prev_disk_counters.get(device)
+                if prev_stats is None:  # Device appeared since the last tick
+                    continue
                 
                 # Calculate rates
                 read_rate = (stats.read_bytes - prev_stats.read_bytes) / interval
                 write_rate = (stats.write_bytes - prev_stats.write_bytes) / interval
                 
                 # Update graphs
-                self.disk_stats[device]['read'].add_point(read_rate / 1_000_000)  # MB/s
-                self.disk_stats[device]['write'].add_point(write_rate / 1_000_000)  # MB/s
+                self.disk_stats[device]['read'].add_point(read_rate / 1_000_000, now)  # MB/s
+                self.disk_stats[device]['write'].add_point(write_rate / 1_000_000, now)  # MB/s
                 
                 # Calculate busy time percentage
                 if hasattr(stats, 'busy_time') and hasattr(prev_stats, 'busy_time'):
@@ -519,28 +582,19 @@ class ResourceMonitor(Container):
                     busy_percent = 0
                 
                 # Add table row
-                table.add_row(
+                rows.append((
                     device,
                     f"← {self._format_size(read_rate)}/s",
                     f"→ {self._format_size(write_rate)}/s",
                     f"{busy_percent:.1f}%"
-                )
+                ))
             
+            # Drop history for devices that are no longer present
+            for device in self.disk_stats.keys() - counters.keys():
+                del self.disk_stats[device]
+
             # Update display
-            disk_stats = self.query_one("#disk-stats", Container)
-            if disk_stats:
-                disk_stats.remove_children()
-                disk_stats.mount(table)
-                
-                # Add graphs for each device
-                for device in counters.keys():
-                    text = Text()
-                    text.append(f"\n{device}\n", style="bold green")
-                    text.append("Read: ", style="green")
-                    text.append(self.disk_stats[device]['read'].get_sparkline())
-                    text.append("\nWrite: ", style="green")
-                    text.append(self.disk_stats[device]['write'].get_sparkline())
-                    disk_stats.mount(Static(text))
+            self._render_io_section("disk-stats", rows, self.disk_stats, DISK_SERIES)
             
             self.prev_disk_counters = counters
             self.disk_update_time = current_time
@@ -557,35 +611,32 @@ class ResourceMonitor(Container):
                 return
                 
             table.clear()
-            processes = []
             
-            # Collect process information
+            # Collect lightweight process information; only the rows that
+            # will be displayed are formatted and queried for I/O counters
+            processes = []
             for proc in psutil.process_iter(['pid', 'name', 'username', 'cpu_percent',
                                            'memory_percent', 'status', 'num_threads']):
+                processes.append((proc.info['cpu_percent'] or 0.0, proc))
+            top = heapq.nlargest(MAX_PROCESSES, processes, key=lambda x: x[0])
+            
+            for _, proc in top:
                 try:
                     pinfo = proc.info
                     io_counters = proc.io_counters() if hasattr(proc, 'io_counters') else None
                     
-                    processes.append((
-                        pinfo['cpu_percent'] or 0.0,
-                        [
-                            str(pinfo['pid']),
-                            pinfo['name'][:20],
-                            f"{pinfo['cpu_percent']:.1f}%" if pinfo['cpu_percent'] else "0.0%",
-                            f"{pinfo['memory_percent']:.1f}%" if pinfo['memory_percent'] else "0.0%",
-                            pinfo['status'],
-                            str(pinfo['num_threads']),
-                            f"{self._format_size(io_counters.read_bytes)}/s" if io_counters else "N/A",
-                            f"{self._format_size(io_counters.write_bytes)}/s" if io_counters else "N/A"
-                        ]
-                    ))
+                    table.add_row(
+                        str(pinfo['pid']),
+                        pinfo['name'][:20],
+                        f"{pinfo['cpu_percent']:.1f}%" if pinfo['cpu_percent'] else "0.0%",
+                        f"{pinfo['memory_percent']:.1f}%" if pinfo['memory_percent'] else "0.0%",
+                        pinfo['status'],
+                        str(pinfo['num_threads']),
+                        f"{self._format_size(io_counters.read_bytes)}/s" if io_counters else "N/A",
+                        f"{self._format_size(io_counters.write_bytes)}/s" if io_counters else "N/A"
+                    )
                 except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
                     continue
-            
-            # Sort by CPU usage and take top processes
-            processes.sort(reverse=True, key=lambda x: x[0])
-            for _, row in processes[:MAX_PROCESSES]:
-                table.add_row(*row)
                 
         except Exception as e:
             self.handle_error(e, "Process List")
@@ -8,7 +8,7 @@ from textual.app import App, ComposeResult
 from textual.widgets import DataTable, Static, Select, Button
 from src.ui.file_browser import ViewMode
 
-from src.ui.file_browser import FileBrowser
+from src.ui.file_browser import FileBrowser, _owner_name
 
 # Base test application
 class TestApp(App):
@@ -102,3 +102,30 @@ async def test_file_browser_view_modes(app):
         await app._process_messages()
         assert browser.view_mode == ViewMode.LIST
 
+def test_owner_name_falls_back_to_uid():
+    """Test that unknown user IDs resolve to the numeric ID."""
+    assert _owner_name(2**31 - 2) == str(2**31 - 2)
+
+def test_get_permissions():
+    """Test mode bits are rendered as an rwx string."""
+    browser = FileBrowser()
+    assert browser._get_permissions(0o100644) == "rw-r--r--"
+    assert browser._get_permissions(0o040755) == "rwxr-xr-x"
+
+@pytest.mark.asyncio
+async def test_file_browser_loads_once_per_navigation(app, tmp_path):
+    """Test that changing directory lists it exactly once."""
+    (tmp_path / "child").mkdir()
+    (tmp_path / "file.txt").write_text("data")
+    async with app.run_test() as pilot:
+        browser = app.query_one(FileBrowser)
+        calls = []
+        original = browser.load_directory
+        browser.load_directory = lambda: (calls.append(1), original())
+
+        browser.current_path = tmp_path
+        await pilot.pause()
+
+        assert len(calls) == 1
+        assert sorted(f.name for f in browser._files) == ["child", "file.txt"]
+        assert [f.is_dir for f in browser._files] == [True, False]
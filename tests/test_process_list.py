@@ -0,0 +1,78 @@
+"""
+Tests for the ProcessListWidget in the main application.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+from textual.app import App, ComposeResult
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+@pytest.fixture
+def process_list_widget(monkeypatch):
+    """Import ProcessListWidget the way main runs, from inside src/."""
+    # main imports its siblings as top-level packages; keep that path and
+    # the modules loaded through it out of the rest of the session
+    monkeypatch.syspath_prepend(str(SRC_DIR))
+    loaded = set(sys.modules)
+    yield importlib.import_module("main").ProcessListWidget
+    for name in set(sys.modules) - loaded:
+        if name == "main" or name.split(".")[0] in ("config", "processes", "ui"):
+            del sys.modules[name]
+
+class FakeMonitor:
+    """Monitor returning a preset sequence of process snapshots."""
+
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+
+    def get_process_list(self):
+        return self.snapshots.pop(0)
+
+    def format_process_data(self, process):
+        return {
+            "PID": str(process["pid"]),
+            "Name": process["name"],
+            "CPU %": f"{process['cpu_percent']:.1f}%",
+            "Memory %": "1.0%",
+            "Status": "running",
+            "User": "testuser",
+            "Started": "00:00:00",
+        }
+
+def make_process(pid, name, cpu_percent):
+    return {"pid": pid, "name": name, "cpu_percent": cpu_percent}
+
+class ProcessListApp(App):
+    """Test application for ProcessListWidget."""
+
+    def __init__(self, widget_class, monitor):
+        super().__init__()
+        self.widget_class = widget_class
+        self.monitor = monitor
+
+    def compose(self) -> ComposeResult:
+        yield self.widget_class(self.monitor)
+
+@pytest.mark.asyncio
+async def test_update_process_list_patches_rows(process_list_widget):
+    """Test that a refresh removes, adds and updates rows by PID."""
+    monitor = FakeMonitor([
+        {1: make_process(1, "init", 0.5), 2: make_process(2, "exited", 1.0)},
+        {1: make_process(1, "init", 3.0), 3: make_process(3, "started", 2.0)},
+    ])
+    app = ProcessListApp(process_list_widget, monitor)
+
+    async with app.run_test():
+        widget = app.query_one(process_list_widget)
+        table = widget.process_table
+        assert [key.value for key in table.rows] == ["1", "2"]
+
+        widget.update_process_list()
+
+        assert [key.value for key in table.rows] == ["1", "3"]
+        assert table.get_row("1")[2] == "3.0%"
+        assert table.get_row("3")[1] == "started"
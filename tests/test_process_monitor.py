@@ -10,6 +10,8 @@ Tests cover:
 """
 
 import pytest
+import time
+from collections import deque
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
 import psutil
@@ -18,7 +20,8 @@ from src.processes.monitor import (
     ProcessMonitor,
     ProcessInfo,
     SystemResources,
-    ProcessHistoryEntry
+    ProcessHistoryEntry,
+    AsyncMonitor
 )
 
 # Test data
@@ -136,6 +139,79 @@ def test_get_process_list(process_monitor, mock_psutil):
     assert process["cpu_percent"] == MOCK_PROCESS_INFO["cpu_percent"]
     assert process["memory_percent"] == MOCK_PROCESS_INFO["memory_percent"]
 
+def test_get_process_list_links_children(process_monitor, mock_psutil):
+    """Test that children are derived from the parent PIDs of listed processes."""
+    parent = mock_psutil.process_iter.return_value[0]
+    child = MagicMock()
+    child.pid = 1235
+    child.name.return_value = "child_process"
+    child.status.return_value = "sleeping"
+    child.cpu_percent.return_value = 0.0
+    child.memory_percent.return_value = 0.1
+    child.username.return_value = "testuser"
+    child.create_time.return_value = MOCK_PROCESS_INFO["create_time"].timestamp()
+    child.num_threads.return_value = 1
+    child.ppid.return_value = parent.pid
+    child.cmdline.return_value = []
+    child.cwd.return_value = "/"
+    mock_psutil.process_iter.return_value = [parent, child]
+
+    processes = process_monitor.get_process_list()
+
+    assert processes[parent.pid]["children"] == [1235]
+    assert processes[1235]["children"] == []
+    parent.children.assert_not_called()
+
+def test_get_process_list_links_denied_children(process_monitor, mock_psutil):
+    """Test that a child whose details are denied is still linked to its parent."""
+    mock_psutil.NoSuchProcess = psutil.NoSuchProcess
+    mock_psutil.AccessDenied = psutil.AccessDenied
+    mock_psutil.ZombieProcess = psutil.ZombieProcess
+    parent = mock_psutil.process_iter.return_value[0]
+    child = MagicMock()
+    child.pid = 1235
+    child.ppid.return_value = parent.pid
+    child.cwd.side_effect = psutil.AccessDenied(1235)
+    mock_psutil.process_iter.return_value = [parent, child]
+
+    processes = process_monitor.get_process_list()
+
+    assert 1235 not in processes
+    assert processes[parent.pid]["children"] == [1235]
+
+def test_get_process_list_records_history(process_monitor, mock_psutil):
+    """Test that history is taken from the listed snapshot without a rescan."""
+    process_monitor.last_history_update -= timedelta(seconds=process_monitor.history_interval)
+    mock_psutil.process_iter.reset_mock()
+
+    process_monitor.get_process_list()
+
+    assert mock_psutil.process_iter.call_count == 1
+    history = process_monitor.get_process_history(MOCK_PROCESS_INFO["pid"])
+    assert history[-1].cpu_percent == MOCK_PROCESS_INFO["cpu_percent"]
+
+def test_get_process_list_skips_history_between_intervals(process_monitor, mock_psutil):
+    """Test that no history is built before the history interval has passed."""
+    with patch("src.processes.monitor.ProcessHistoryEntry") as mock_entry:
+        process_monitor.get_process_list()
+
+    mock_entry.assert_not_called()
+    assert MOCK_PROCESS_INFO["pid"] not in process_monitor.process_history
+
+def test_get_process_list_records_history_when_access_denied(process_monitor, mock_psutil):
+    """Test that processes with unreadable details still get history."""
+    mock_psutil.NoSuchProcess = psutil.NoSuchProcess
+    mock_psutil.AccessDenied = psutil.AccessDenied
+    mock_psutil.ZombieProcess = psutil.ZombieProcess
+    mock_psutil.process_iter.return_value[0].cwd.side_effect = psutil.AccessDenied(1234)
+    process_monitor.last_history_update -= timedelta(seconds=process_monitor.history_interval)
+
+    processes = process_monitor.get_process_list()
+
+    assert MOCK_PROCESS_INFO["pid"] not in processes
+    history = process_monitor.get_process_history(MOCK_PROCESS_INFO["pid"])
+    assert history[-1].memory_percent == MOCK_PROCESS_INFO["memory_percent"]
+
 def test_get_process_list_error_handling(process_monitor, mock_psutil):
     """Test error handling in get_process_list."""
     mock_psutil.process_iter.side_effect = Exception("Test error")
@@ -157,6 +233,28 @@ def test_get_system_resources(process_monitor, mock_psutil):
     assert resources["swap_used"] == MOCK_SYSTEM_RESOURCES["swap_used"]
     assert resources["swap_percent"] == MOCK_SYSTEM_RESOURCES["swap_percent"]
 
+def test_get_system_resources_caches_disk_usage(process_monitor, mock_psutil):
+    """Test that disk usage is reused within its TTL and refreshed after."""
+    process_monitor.get_system_resources()
+    process_monitor.get_system_resources()
+    assert mock_psutil.disk_usage.call_count == 1
+
+    process_monitor._disk_usage_time -= process_monitor._disk_usage_ttl
+    process_monitor.get_system_resources()
+    assert mock_psutil.disk_usage.call_count == 2
+
+def test_get_system_resources_disk_usage_is_a_copy(process_monitor, mock_psutil):
+    """Test that mutating returned disk usage leaves the cache intact."""
+    mock_psutil.disk_usage.return_value._asdict.return_value = dict(
+        MOCK_SYSTEM_RESOURCES["disk_usage"]["/"]
+    )
+    resources = process_monitor.get_system_resources()
+    resources["disk_usage"]["/"]["percent"] = 99.0
+    resources["disk_usage"].clear()
+
+    disk_usage = process_monitor.get_system_resources()["disk_usage"]
+    assert disk_usage["/"]["percent"] == MOCK_SYSTEM_RESOURCES["disk_usage"]["/"]["percent"]
+
 def test_get_process_tree(process_monitor, mock_psutil):
     """Test getting process tree with multi-level hierarchy and cache verification."""
     # Create a mock process tree:
@@ -312,13 +410,13 @@ def test_process_tree_cache_expiration(process_monitor, mock_psutil):
 def test_process_history_tracking(process_monitor, mock_psutil):
     """Test process history tracking."""
     # First update
-    process_monitor._update_history_if_needed()
+    process_monitor.get_process_list()
     
     # Force time to pass
     process_monitor.last_history_update -= timedelta(seconds=2)
     
     # Second update
-    process_monitor._update_history_if_needed()
+    process_monitor.get_process_list()
     
     history = process_monitor.get_process_history(MOCK_PROCESS_INFO["pid"])
     assert len(history) > 0
@@ -345,6 +443,24 @@ def test_format_resource_data(process_monitor):
     assert "Swap" in formatted
     assert "Load Average" in formatted
 
+def test_get_process_history_trims_expired(process_monitor):
+    """Test that expired entries are dropped from the front of a history."""
+    now = datetime.now()
+    process_monitor.process_history[1234] = deque(
+        ProcessHistoryEntry(
+            timestamp=now - timedelta(seconds=age),
+            cpu_percent=float(age),
+            memory_percent=1.0,
+            status="running"
+        )
+        for age in (process_monitor.history_length + 10, 5, 0)
+    )
+
+    history = process_monitor.get_process_history(1234)
+
+    assert [entry.cpu_percent for entry in history] == [5.0, 0.0]
+    assert len(process_monitor.process_history[1234]) == 2
+
 def test_history_cleanup(process_monitor):
     """Test that old history entries are cleaned up."""
     # Add old history entry
@@ -354,7 +470,7 @@ def test_history_cleanup(process_monitor):
         memory_percent=1.0,
         status="running"
     )
-    process_monitor.process_history[1234] = [old_entry]
+    process_monitor.process_history[1234] = deque([old_entry])
     
     # Add new history entry
     new_entry = ProcessHistoryEntry(
@@ -365,11 +481,60 @@ def test_history_cleanup(process_monitor):
     )
     process_monitor.process_history[1234].append(new_entry)
     
-    # Force cleanup
-    process_monitor._update_history_if_needed()
+    # Force cleanup with an empty snapshot once the interval has passed
+    process_monitor.last_history_update -= timedelta(seconds=process_monitor.history_interval)
+    process_monitor._update_history_if_needed({})
     
     # Verify old entry was removed
     history = process_monitor.process_history[1234]
     assert len(history) == 1
     assert history[0].cpu_percent == 2.0
 
+
+def test_async_monitor_stop_wakes_loop(mock_psutil):
+    """Test that stopping the async monitor does not wait out the update interval."""
+    monitor = Mock()
+    monitor.get_process_list.return_value = {}
+    monitor.get_system_resources.return_value = {
+        **MOCK_SYSTEM_RESOURCES, "disk_usage": {}
+    }
+    async_monitor = AsyncMonitor(monitor, update_interval=60)
+    async_monitor.start()
+    time.sleep(0.1)
+
+    start = time.monotonic()
+    async_monitor.stop()
+    async_monitor._executor.shutdown(wait=True)
+    assert time.monotonic() - start < 5
+
+def test_check_thresholds_system_wide():
+    """Test that each system-wide resource over its threshold is reported."""
+    async_monitor = AsyncMonitor(Mock())
+    async_monitor.logger = Mock()
+    resources = {
+        **MOCK_SYSTEM_RESOURCES,
+        "cpu_percent": 95.0,
+        "memory_percent": 10.0,
+        "swap_percent": 85.0,
+    }
+
+    async_monitor._check_thresholds({}, resources)
+
+    messages = [call.args[0] for call in async_monitor.logger.warning.call_args_list]
+    assert any(m.startswith("High CPU usage") for m in messages)
+    assert any(m.startswith("High swap usage") for m in messages)
+    assert not any(m.startswith("High memory usage") for m in messages)
+
+def test_check_thresholds_logs_on_transition():
+    """Test that a sustained breach is logged once until it clears."""
+    async_monitor = AsyncMonitor(Mock())
+    async_monitor.logger = Mock()
+    high = {**MOCK_SYSTEM_RESOURCES, "cpu_percent": 95.0}
+
+    async_monitor._check_thresholds({}, high)
+    async_monitor._check_thresholds({}, high)
+    assert async_monitor.logger.warning.call_count == 1
+
+    async_monitor._check_thresholds({}, MOCK_SYSTEM_RESOURCES)
+    async_monitor._check_thresholds({}, high)
+    assert async_monitor.logger.warning.call_count == 2
@@ -8,6 +8,8 @@ from textual.app import App, ComposeResult
 from textual.widgets import DataTable, ProgressBar, Label
 from textual.message import Message
 import asyncio
+import psutil
+from datetime import datetime
 
 from src.ui.resource_monitor import ResourceMonitor, TimeSeriesGraph
 
@@ -72,6 +74,11 @@ async def test_time_series_graph():
     assert len(graph.values) == 1
     assert graph.values[0] == 0.5
     
+    # Test explicit timestamps
+    stamp = datetime(2024, 1, 1)
+    graph.add_point(0.25, stamp)
+    assert graph.timestamps[-1] == stamp
+    
     # Test max points limit
     for i in range(15):
         graph.add_point(i / 15)
@@ -81,6 +88,17 @@ async def test_time_series_graph():
     sparkline = graph.get_sparkline(width=10)
     assert len(sparkline.plain) == 10
 
+def test_sparkline_downsampling_keeps_newest_points():
+    """Test that downsampled sparklines cover the whole history."""
+    graph = TimeSeriesGraph(max_points=120)
+    for i in range(120):
+        graph.add_point(1.0 if i >= 100 else 0.0)
+
+    sparkline = graph.get_sparkline(width=50)
+    assert len(sparkline.plain) == 50
+    assert sparkline.plain[-1] == "█"
+    assert sparkline.plain[0] == "▁"
+
 @pytest.mark.asyncio
 async def test_resource_monitor_updates(app):
     """Test that monitor updates work correctly."""
@@ -110,3 +128,67 @@ async def test_resource_monitor_updates(app):
         assert hasattr(mem_progress, "progress")
         assert 0 <= mem_progress.progress <= 100
 
+
+@pytest.mark.asyncio
+async def test_resource_monitor_reuses_graph_labels(app):
+    """Test that repeated updates do not mount new widgets each tick."""
+    async with app.run_test() as pilot:
+        monitor = app.query_one(ResourceMonitor)
+        memory = monitor.query_one("#memory-usage")
+        before = len(memory.children)
+
+        monitor.update_memory()
+        monitor.update_memory()
+        await pilot.pause()
+
+        assert len(memory.children) == before
+
+@pytest.mark.asyncio
+async def test_resource_monitor_reuses_core_labels(app):
+    """Test that per-core labels are mounted once and updated in place."""
+    async with app.run_test() as pilot:
+        monitor = app.query_one(ResourceMonitor)
+        cores = monitor.query_one("#cpu-cores")
+
+        monitor.update_cpu()
+        await pilot.pause()
+        labels = list(cores.children)
+        monitor.update_cpu()
+        await pilot.pause()
+
+        assert list(cores.children) == labels
+        assert len(labels) == psutil.cpu_count()
+
+@pytest.mark.asyncio
+async def test_resource_monitor_prunes_stale_interfaces(app):
+    """Test that history for vanished network interfaces is dropped."""
+    async with app.run_test():
+        monitor = app.query_one(ResourceMonitor)
+        monitor.net_stats["gone0"] = {
+            'sent': TimeSeriesGraph(),
+            'received': TimeSeriesGraph()
+        }
+        monitor.prev_net_counters = psutil.net_io_counters(pernic=True)
+        monitor.net_update_time -= 1
+
+        monitor.update_network()
+
+        assert "gone0" not in monitor.net_stats
+
+
+@pytest.mark.asyncio
+async def test_resource_monitor_reuses_io_table(app):
+    """Test that the network table is updated in place across ticks."""
+    async with app.run_test() as pilot:
+        monitor = app.query_one(ResourceMonitor)
+        table = monitor.query_one("#network-stats .io-table", DataTable)
+        monitor.prev_net_counters = psutil.net_io_counters(pernic=True)
+
+        for _ in range(2):
+            monitor.net_update_time -= 1
+            monitor.update_network()
+            await pilot.pause()
+
+        assert monitor.query_one("#network-stats .io-table", DataTable) is table
+        assert len(monitor.query("#network-stats DataTable")) == 1
+        assert table.row_count == len(psutil.net_io_counters(pernic=True))
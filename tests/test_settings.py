@@ -0,0 +1,129 @@
+"""
+Tests for dashboard configuration loading, saving and validation.
+"""
+
+import os
+
+import pytest
+
+from src.config.settings import DashboardConfig
+
+def test_default_config_is_valid():
+    """Test that the default configuration passes validation."""
+    assert DashboardConfig().validate()
+
+@pytest.mark.parametrize("color", ["#00FF00", "#abcdef", "#000000"])
+def test_validate_accepts_hex_colors(color):
+    """Test that #RRGGBB colors are accepted."""
+    config = DashboardConfig()
+    config.theme.text_color = color
+    assert config.validate()
+
+@pytest.mark.parametrize("color", ["00FF00", "#00FF0", "#00FF000", "#GGGGGG", "#00ff0\n"])
+def test_validate_rejects_bad_colors(color):
+    """Test that malformed colors are rejected."""
+    config = DashboardConfig()
+    config.theme.text_color = color
+    assert not config.validate()
+
+def test_load_round_trip(tmp_path):
+    """Test that a saved configuration loads back unchanged."""
+    path = tmp_path / "config.yaml"
+    config = DashboardConfig()
+    config.updates.disk_update_interval = 7.5
+    config.layout.grid_columns = 3
+    config.save(path)
+
+    assert DashboardConfig.load(path) == config
+
+def test_load_tolerates_empty_sections(tmp_path):
+    """Test that empty files and sections fall back to field defaults."""
+    path = tmp_path / "config.yaml"
+    path.write_text("")
+    assert DashboardConfig.load(path) == DashboardConfig()
+
+    path.write_text("theme:\nupdates:\n  disk_update_interval: 9.0\n")
+    config = DashboardConfig.load(path)
+    assert config.theme == DashboardConfig().theme
+    assert config.updates.disk_update_interval == 9.0
+
+def test_save_creates_missing_directory(tmp_path):
+    """Test that saving creates the configuration directory on demand."""
+    path = tmp_path / "nested" / "config.yaml"
+    DashboardConfig().save(path)
+    assert path.exists()
+
+def test_default_path_does_not_create_directory(tmp_path, monkeypatch):
+    """Test that resolving the default path has no filesystem side effects."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    path = DashboardConfig.get_default_config_path()
+    assert path == tmp_path / ".config" / "process_dashboard" / "config.yaml"
+    assert not path.parent.exists()
+
+def test_save_replaces_file_atomically(tmp_path):
+    """Test that saving overwrites the config without leaving a temp file."""
+    path = tmp_path / "config.yaml"
+    path.write_text("stale: true\n")
+    path.chmod(0o644)
+    DashboardConfig().save(path)
+
+    assert path.stat().st_mode & 0o777 == 0o644
+
+    assert DashboardConfig.load(path) == DashboardConfig()
+    assert [p.name for p in tmp_path.iterdir()] == ["config.yaml"]
+
+def test_save_new_file_uses_umask_mode(tmp_path):
+    """Test that a first save gets the permissions open() would give it."""
+    path = tmp_path / "config.yaml"
+    old_umask = os.umask(0o022)
+    try:
+        DashboardConfig().save(path)
+    finally:
+        os.umask(old_umask)
+
+    assert path.stat().st_mode & 0o777 == 0o644
+
+@pytest.mark.parametrize("interval", [0, -1.0, "fast", True])
+def test_validate_rejects_bad_intervals(interval):
+    """Test that non-positive or non-numeric intervals are rejected."""
+    config = DashboardConfig()
+    config.updates.resource_update_interval = interval
+    assert not config.validate()
+
+def test_validate_rejects_bad_grid():
+    """Test that grid dimensions must be positive integers."""
+    config = DashboardConfig()
+    config.layout.grid_rows = 0
+    assert not config.validate()
+    config.layout.grid_rows = "2"
+    assert not config.validate()
+    config.layout.grid_rows = True
+    assert not config.validate()
+
+def test_save_keeps_symlinked_config(tmp_path):
+    """Test that saving through a symlink updates its target in place."""
+    target = tmp_path / "dotfiles" / "config.yaml"
+    target.parent.mkdir()
+    target.write_text("")
+    link = tmp_path / "config.yaml"
+    link.symlink_to(target)
+
+    config = DashboardConfig()
+    config.layout.grid_rows = 4
+    config.save(link)
+
+    assert link.is_symlink()
+    assert DashboardConfig.load(target) == config
+
+def test_save_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    """Test that a failed save leaves no temp file behind."""
+    path = tmp_path / "config.yaml"
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("src.config.settings.os.replace", fail)
+    with pytest.raises(OSError):
+        DashboardConfig().save(path)
+
+    assert list(tmp_path.iterdir()) == []